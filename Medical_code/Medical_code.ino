@@ -32,7 +32,7 @@ void setup() {
   display.setTextSize(1);
   display.setTextColor(WHITE);
 
-  Serial.println("Send: HR MAP RR SPO2");
+  Serial.println(F("Send: HR MAP RR SPO2"));
 }
 
 void loop() {
@@ -50,10 +50,10 @@ void loop() {
       RR = r;
       SPO2 = s;
 
-      Serial.print("UPDATED -> ");
-      Serial.print(HR); Serial.print(" ");
-      Serial.print(MAP); Serial.print(" ");
-      Serial.print(RR); Serial.print(" ");
+      Serial.print(F("UPDATED -> "));
+      Serial.print(HR); Serial.print(' ');
+      Serial.print(MAP); Serial.print(' ');
+      Serial.print(RR); Serial.print(' ');
       Serial.println(SPO2);
     }
 
@@ -61,8 +61,10 @@ void loop() {
   }
 
   /* ===== CONTROL LOOP ===== */
-  if (millis() - lastUpdate >= interval) {
-    lastUpdate = millis();
+  unsigned long now = millis();
+  if (now - lastUpdate >= interval) {
+    lastUpdate += interval;           // fixed cadence, no cumulative drift
+    if (now - lastUpdate >= interval) lastUpdate = now;  // resync after a stall
 
     int servoAngle;
     bool danger = false;
@@ -91,7 +93,7 @@ void loop() {
       digitalWrite(BUZZER_PIN, HIGH);               // continuous
     }
     else if (warning) {
-      digitalWrite(BUZZER_PIN, (millis() / 300) % 2); // beep
+      digitalWrite(BUZZER_PIN, (now / 300) % 2);      // beep
     }
     else {
       digitalWrite(BUZZER_PIN, LOW);
@@ -100,26 +102,26 @@ void loop() {
     /* ===== OLED ===== */
     display.clearDisplay();
     display.setCursor(0,0);
-    display.print("HR:"); display.print(HR);
-    display.print(" MAP:"); display.print(MAP);
+    display.print(F("HR:")); display.print(HR);
+    display.print(F(" MAP:")); display.print(MAP);
 
     display.setCursor(0,12);
-    display.print("RR:"); display.print(RR);
-    display.print(" SpO2:"); display.print(SPO2);
+    display.print(F("RR:")); display.print(RR);
+    display.print(F(" SpO2:")); display.print(SPO2);
 
     display.setCursor(0,24);
-    display.print("Servo:");
+    display.print(F("Servo:"));
     display.print(servoAngle);
-    display.print(" deg");
+    display.print(F(" deg"));
 
     display.display();
 
     /* ===== LOG ===== */
-    Serial.print("HR="); Serial.print(HR);
-    Serial.print(" MAP="); Serial.print(MAP);
-    Serial.print(" RR="); Serial.print(RR);
-    Serial.print(" SpO2="); Serial.print(SPO2);
-    Serial.print(" Servo=");
+    Serial.print(F("HR=")); Serial.print(HR);
+    Serial.print(F(" MAP=")); Serial.print(MAP);
+    Serial.print(F(" RR=")); Serial.print(RR);
+    Serial.print(F(" SpO2=")); Serial.print(SPO2);
+    Serial.print(F(" Servo="));
     Serial.println(servoAngle);
   }
 }
\ No newline at end of file